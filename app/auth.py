@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
@@ -15,7 +16,7 @@ class Role(str, Enum):
     STORE = "STORE"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Principal:
     id: int
     username: str
@@ -33,12 +34,21 @@ def get_current_principal(request: Request) -> Principal:
     return principal
 
 
+# Keep MANAGER as a supported legacy admin role.
+_ADMIN_ROLES = frozenset((Role.ADMIN, Role.MANAGER))
+
+
 def is_admin_role(role: Role) -> bool:
-    # Keep MANAGER as a supported legacy admin role.
-    return role in {Role.ADMIN, Role.MANAGER}
+    return role in _ADMIN_ROLES
 
 
 def require_role(*allowed: Role):
+    # Identical role sets share one dependency callable regardless of argument order.
+    return _role_dependency(frozenset(allowed))
+
+
+@lru_cache(maxsize=None)
+def _role_dependency(allowed: frozenset[Role]):
     def _dep(principal: Principal = Depends(get_current_principal)) -> Principal:
         if principal.role not in allowed:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
@@ -48,7 +58,7 @@ def require_role(*allowed: Role):
 
 
 def require_capability(permission_key: str, *fallback_roles: Role):
-    fallback_set = {role for role in fallback_roles}
+    fallback_set = frozenset(fallback_roles)
 
     def _dep(
         principal: Principal = Depends(get_current_principal),
@@ -11,6 +11,7 @@ from fastapi.templating import Jinja2Templates
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.auth import Role, get_current_principal
+from app.config import settings
 from app.schema_contract import assert_supported_schema
 from app.routers import (
     auth,
@@ -36,8 +37,10 @@ from app.v2.feature_exposure import FeatureExposure
 
 app = FastAPI(title='Blind Inventory Portal')
 
-TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
 app.state.templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# Compiled templates stay in Jinja's in-memory cache; only development re-stats files for edits.
+app.state.templates.env.auto_reload = settings.environment_normalized == 'development'
 PORTAL_TIMEZONE = ZoneInfo('America/Los_Angeles')
 _template_response_impl = app.state.templates.TemplateResponse
 
@@ -116,11 +119,6 @@ def _jinja_finalize(value):
     return value
 
 
-def _csrf_token(request: Request) -> str:
-    return getattr(request.state, 'csrf_token', '')
-
-
-app.state.templates.env.globals['csrf_token'] = _csrf_token
 app.state.templates.env.globals['format_portal_datetime'] = _format_portal_datetime
 app.state.templates.env.globals['v2_status'] = status_context
 app.state.templates.env.globals['asset_version'] = (
@@ -128,7 +126,7 @@ app.state.templates.env.globals['asset_version'] = (
 )[:12]
 app.state.templates.env.finalize = _jinja_finalize
 
-V2_STATIC_DIR = Path(__file__).resolve().parent / 'static' / 'v2'
+V2_STATIC_DIR = Path(__file__).parent / 'static' / 'v2'
 app.mount('/v2-assets', StaticFiles(directory=str(V2_STATIC_DIR)), name='v2-assets')
 
 install_security_headers(app)
@@ -167,6 +165,10 @@ def root(request: Request):
     return RedirectResponse('/login', status_code=303)
 
 
+ROBOTS_TXT = 'User-agent: *\nDisallow: /\n'
+
+
 @app.get('/robots.txt', response_class=PlainTextResponse)
-def robots_txt() -> str:
-    return 'User-agent: *\nDisallow: /\n'
+def robots_txt() -> PlainTextResponse:
+    # Middleware adds headers and cookies to the response, so build a fresh one per request.
+    return PlainTextResponse(ROBOTS_TXT, headers={'Cache-Control': 'public, max-age=86400'})
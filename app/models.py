@@ -23,7 +23,7 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import CITEXT, INET
+from sqlalchemy.dialects.postgresql import CITEXT, INET, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -376,7 +376,7 @@ class AuditLog(Base):
     action: Mapped[str] = mapped_column(Text, nullable=False)
     session_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey('count_sessions.id'))
     ip: Mapped[str | None] = mapped_column(INET)
-    meta: Mapped[dict] = mapped_column('metadata', JSON, nullable=False, default=dict, server_default='{}')
+    meta: Mapped[dict] = mapped_column('metadata', JSONB, nullable=False, default=dict, server_default='{}')
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
@@ -2665,8 +2665,8 @@ class SquareSyncEvent(Base):
         default=SquareSyncStatus.PENDING,
         server_default='PENDING',
     )
-    request_payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict, server_default='{}')
-    response_payload: Mapped[dict | None] = mapped_column(JSON)
+    request_payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict, server_default='{}')
+    response_payload: Mapped[dict | None] = mapped_column(JSONB)
     error_text: Mapped[str | None] = mapped_column(Text)
     attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
     last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
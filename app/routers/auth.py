@@ -2,13 +2,12 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.db import get_db
-from app.dependencies import get_client_ip, get_templates
+from app.dependencies import get_client_ip
 from app.models import Principal as PrincipalModel
 from app.security.csrf import verify_csrf
 from app.security.passwords import verify_password
@@ -19,8 +18,8 @@ router = APIRouter(tags=['auth'])
 
 
 @router.get('/login')
-def login_page(request: Request, templates: Jinja2Templates = Depends(get_templates)):
-    return templates.TemplateResponse('login.html', {'request': request, 'error': None})
+def login_page(request: Request):
+    return request.app.state.templates.TemplateResponse('login.html', {'request': request, 'error': None})
 
 
 @router.post('/login')
@@ -37,46 +36,20 @@ async def login_submit(
 
     principal = db.execute(select(PrincipalModel).where(PrincipalModel.username == username)).scalar_one_or_none()
     if not principal:
+        failure_reason = 'UNKNOWN_USERNAME'
+    elif not principal.active:
+        failure_reason = 'INACTIVE_PRINCIPAL'
+    elif not verify_password(password, principal.password_hash):
+        failure_reason = 'BAD_PASSWORD'
+    else:
+        failure_reason = None
+    if failure_reason:
         log_auth_event(
             db,
             attempted_username=username,
             success=False,
-            failure_reason='UNKNOWN_USERNAME',
-            principal_id=None,
-            ip=ip,
-            user_agent=user_agent,
-        )
-        db.commit()
-        return request.app.state.templates.TemplateResponse(
-            'login.html',
-            {'request': request, 'error': 'Invalid username or password'},
-            status_code=401,
-        )
-
-    if not principal.active:
-        log_auth_event(
-            db,
-            attempted_username=username,
-            success=False,
-            failure_reason='INACTIVE_PRINCIPAL',
-            principal_id=principal.id,
-            ip=ip,
-            user_agent=user_agent,
-        )
-        db.commit()
-        return request.app.state.templates.TemplateResponse(
-            'login.html',
-            {'request': request, 'error': 'Invalid username or password'},
-            status_code=401,
-        )
-
-    if not verify_password(password, principal.password_hash):
-        log_auth_event(
-            db,
-            attempted_username=username,
-            success=False,
-            failure_reason='BAD_PASSWORD',
-            principal_id=principal.id,
+            failure_reason=failure_reason,
+            principal_id=principal.id if principal else None,
             ip=ip,
             user_agent=user_agent,
         )
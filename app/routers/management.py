@@ -40,7 +40,6 @@ from app.services.access_control_service import (
     list_access_control_settings,
     list_role_dashboard_category_access,
     permission_defs,
-    principal_has_permission,
     save_role_dashboard_category_access,
     save_principal_permission_overrides,
     save_role_permission_overrides,
@@ -286,19 +285,12 @@ def home(
     principal: Principal = Depends(management_access),
     db: Session = Depends(get_db),
 ):
-    role_defaults = {
-        key: fallback_allowed_for_role(role=principal.role.value, permission_key=key)
-        for key in ['management.access', 'management.admin', 'management.groups', 'management.users', 'store.access']
-    }
+    # The session middleware already resolved overrides for every permission in bulk.
+    permission_flags = getattr(request.state, 'permission_flags', {}) or {}
     allowed_permission_keys = {
         key
-        for key, fallback in role_defaults.items()
-        if principal_has_permission(
-            db,
-            principal=principal,
-            permission_key=key,
-            fallback_allowed=fallback,
-        )
+        for key in ['management.access', 'management.admin', 'management.groups', 'management.users', 'store.access']
+        if permission_flags.get(key, fallback_allowed_for_role(role=principal.role.value, permission_key=key))
     }
     sections = build_dashboard_sections(
         db,
@@ -453,6 +445,20 @@ def _parse_reconciliation_dates(start_raw: str, end_raw: str) -> tuple[date, dat
     return start_date, end_date
 
 
+def _store_date_filters(request: Request) -> tuple[int | None, str, str, date | None, date | None]:
+    query = request.query_params
+    store_raw = str(query.get('store_id', '')).strip()
+    from_raw = str(query.get('from', '')).strip()
+    to_raw = str(query.get('to', '')).strip()
+    store_id = int(store_raw) if store_raw.isdigit() else None
+    try:
+        from_date = date.fromisoformat(from_raw) if from_raw else None
+        to_date = date.fromisoformat(to_raw) if to_raw else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
+    return store_id, from_raw, to_raw, from_date, to_date
+
+
 def _parse_admin_store_count_quantities(form) -> dict[str, Decimal | None]:
     values: dict[str, Decimal | None] = {}
     for key in form.keys():
@@ -2764,15 +2770,7 @@ def daily_chore_lists_page(
     principal: Principal = Depends(management_access),
     db: Session = Depends(get_db),
 ):
-    selected_store_id_raw = request.query_params.get('store_id', '').strip()
-    from_raw = request.query_params.get('from', '').strip()
-    to_raw = request.query_params.get('to', '').strip()
-    selected_store_id = int(selected_store_id_raw) if selected_store_id_raw.isdigit() else None
-    try:
-        from_date = date.fromisoformat(from_raw) if from_raw else None
-        to_date = date.fromisoformat(to_raw) if to_raw else None
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
+    selected_store_id, from_raw, to_raw, from_date, to_date = _store_date_filters(request)
 
     stores = db.execute(select(Store.id, Store.name).where(Store.active.is_(True)).order_by(Store.name.asc())).all()
     rows = list_sheets_for_audit(
@@ -3024,16 +3022,7 @@ def opening_checklists_page(
     _: Principal = Depends(management_access),
     db: Session = Depends(get_db),
 ):
-    selected_store_id_raw = request.query_params.get('store_id', '').strip()
-    from_raw = request.query_params.get('from', '').strip()
-    to_raw = request.query_params.get('to', '').strip()
-
-    selected_store_id = int(selected_store_id_raw) if selected_store_id_raw.isdigit() else None
-    try:
-        from_date = date.fromisoformat(from_raw) if from_raw else None
-        to_date = date.fromisoformat(to_raw) if to_raw else None
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
+    selected_store_id, from_raw, to_raw, from_date, to_date = _store_date_filters(request)
 
     stores = db.execute(select(Store.id, Store.name).where(Store.active.is_(True)).order_by(Store.name.asc())).all()
     rows = list_submissions(
@@ -3246,15 +3235,7 @@ def exchange_return_forms_page(
     _: Principal = Depends(management_access),
     db: Session = Depends(get_db),
 ):
-    selected_store_id_raw = request.query_params.get('store_id', '').strip()
-    from_raw = request.query_params.get('from', '').strip()
-    to_raw = request.query_params.get('to', '').strip()
-    selected_store_id = int(selected_store_id_raw) if selected_store_id_raw.isdigit() else None
-    try:
-        from_date = date.fromisoformat(from_raw) if from_raw else None
-        to_date = date.fromisoformat(to_raw) if to_raw else None
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
+    selected_store_id, from_raw, to_raw, from_date, to_date = _store_date_filters(request)
 
     stores = db.execute(select(Store.id, Store.name).where(Store.active.is_(True)).order_by(Store.name.asc())).all()
     rows = list_exchange_return_forms(
@@ -3602,15 +3583,7 @@ def customer_requests_page(
     _: Principal = Depends(management_access),
     db: Session = Depends(get_db),
 ):
-    selected_store_id_raw = request.query_params.get('store_id', '').strip()
-    from_raw = request.query_params.get('from', '').strip()
-    to_raw = request.query_params.get('to', '').strip()
-    selected_store_id = int(selected_store_id_raw) if selected_store_id_raw.isdigit() else None
-    try:
-        from_date = date.fromisoformat(from_raw) if from_raw else None
-        to_date = date.fromisoformat(to_raw) if to_raw else None
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
+    selected_store_id, from_raw, to_raw, from_date, to_date = _store_date_filters(request)
 
     stores = db.execute(select(Store.id, Store.name).where(Store.active.is_(True)).order_by(Store.name.asc())).all()
     submissions = list_customer_request_submissions(
@@ -4043,20 +4016,11 @@ def count_square_sync_report_page(
     _: Principal = Depends(require_role(Role.ADMIN)),
     db: Session = Depends(get_db),
 ):
-    selected_store_id_raw = request.query_params.get('store_id', '').strip()
-    from_raw = request.query_params.get('from', '').strip()
-    to_raw = request.query_params.get('to', '').strip()
+    selected_store_id, from_raw, to_raw, from_date, to_date = _store_date_filters(request)
     session_id_raw = request.query_params.get('session_id', '').strip()
     sync_scope_raw = request.query_params.get('sync_scope', '').strip().lower()
-
-    selected_store_id = int(selected_store_id_raw) if selected_store_id_raw.isdigit() else None
     selected_session_id = int(session_id_raw) if session_id_raw.isdigit() else None
     sync_scope = 'recount' if sync_scope_raw == 'recount' else 'all'
-    try:
-        from_date = date.fromisoformat(from_raw) if from_raw else None
-        to_date = date.fromisoformat(to_raw) if to_raw else None
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
 
     stores = db.execute(select(Store.id, Store.name).where(Store.active.is_(True)).order_by(Store.name.asc())).all()
     rows = list_count_square_sync_report_rows(
@@ -4089,16 +4053,7 @@ def recount_change_report_page(
     _: Principal = Depends(admin_access),
     db: Session = Depends(get_db),
 ):
-    selected_store_id_raw = request.query_params.get('store_id', '').strip()
-    from_raw = request.query_params.get('from', '').strip()
-    to_raw = request.query_params.get('to', '').strip()
-
-    selected_store_id = int(selected_store_id_raw) if selected_store_id_raw.isdigit() else None
-    try:
-        from_date = date.fromisoformat(from_raw) if from_raw else None
-        to_date = date.fromisoformat(to_raw) if to_raw else None
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='Invalid date filter') from exc
+    selected_store_id, from_raw, to_raw, from_date, to_date = _store_date_filters(request)
 
     query = (
         select(CountSession.id, CountSession.store_id, CountSession.submitted_at, Store.name)
@@ -10,7 +10,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.auth import Principal, Role, require_capability
+from app.auth import Principal, Role, is_admin_role, require_capability
 from app.config import settings
 from app.db import get_db
 from app.dependencies import get_client_ip
@@ -541,7 +541,7 @@ async def upload_media_route(
     try:
         if group_id and not principal_has_permission(
             db, principal=principal, permission_key='digital_signage.manage_groups',
-            fallback_allowed=principal.role in {Role.ADMIN, Role.MANAGER},
+            fallback_allowed=is_admin_role(principal.role),
         ):
             raise HTTPException(status_code=403)
         from app.config import settings
@@ -10,7 +10,7 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.auth import Principal, Role, require_capability
+from app.auth import Principal, Role, is_admin_role, require_capability
 from app.config import settings
 from app.db import get_db
 from app.dependencies import get_client_ip
@@ -100,7 +100,7 @@ capability_access = require_capability('management.admin', Role.ADMIN, Role.MANA
 
 
 def owner_access(principal: Principal = Depends(capability_access)) -> Principal:
-    if principal.role not in {Role.ADMIN, Role.MANAGER}:
+    if not is_admin_role(principal.role):
         raise HTTPException(status_code=404)
     return principal
 
@@ -10,7 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.auth import Principal, Role, get_current_principal, require_capability
+from app.auth import Principal, Role, get_current_principal, is_admin_role, require_capability
 from app.db import get_db
 from app.dependencies import get_client_ip
 from app.models import ScheduleShift
@@ -71,13 +71,13 @@ def board_access(
         db,
         principal=principal,
         permission_key='scheduling.view_all',
-        fallback_allowed=principal.role in {Role.ADMIN, Role.MANAGER},
+        fallback_allowed=is_admin_role(principal.role),
     )
     view_store = principal_has_permission(
         db,
         principal=principal,
         permission_key='scheduling.view_store',
-        fallback_allowed=principal.role in {Role.ADMIN, Role.MANAGER},
+        fallback_allowed=is_admin_role(principal.role),
     )
     if not (view_all or view_store):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
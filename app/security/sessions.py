@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse, Response
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.auth import Principal, Role
 from app.config import settings
@@ -43,10 +43,11 @@ def create_web_session(db, principal_id: int, ip: str | None, user_agent: str |
 
 
 def revoke_web_session(db, token: str) -> None:
-    session = db.execute(select(WebSession).where(WebSession.session_token == token)).scalar_one_or_none()
-    if not session or session.revoked_at is not None:
-        return
-    session.revoked_at = _now()
+    db.execute(
+        update(WebSession)
+        .where(WebSession.session_token == token, WebSession.revoked_at.is_(None))
+        .values(revoked_at=_now())
+    )
 
 
 def load_session_from_token(db, token: str | None) -> tuple[WebSession, Principal] | None:
@@ -97,6 +98,8 @@ def install_auth_session_middleware(app: FastAPI) -> None:
             or request.url.path.startswith('/touchscreen/')
             or request.url.path in {'/v2-assets/touchscreen.css', '/v2-assets/touchscreen.js'}
         )
+        # Static assets still require a session but never consult capability flags.
+        is_static_asset = request.url.path.startswith('/v2-assets/')
         token = request.cookies.get(settings.session_cookie_name)
         with SessionLocal() as db:
             loaded = load_session_from_token(db, token)
@@ -108,7 +111,7 @@ def install_auth_session_middleware(app: FastAPI) -> None:
             request.state.login_at = web_session.created_at if web_session else None
             permission_flags = (
                 effective_permission_flags(db, principal=principal)
-                if principal is not None
+                if principal is not None and not is_static_asset
                 else {}
             )
             request.state.permission_flags = permission_flags
@@ -38,12 +38,18 @@ def list_suggestions(db: Session, *, limit: int = 30) -> list[str]:
     return [row[0] for row in rows]
 
 
-def _get_or_create_item(db: Session, *, raw_name: str, principal_id: int) -> CustomerRequestItem:
+def _get_or_create_item(
+    db: Session,
+    *,
+    raw_name: str,
+    principal_id: int,
+    items_by_name: dict[str, CustomerRequestItem],
+) -> CustomerRequestItem:
     normalized = normalize_name(raw_name)
     if not normalized:
         raise ValueError('Item name cannot be empty')
 
-    item = db.execute(select(CustomerRequestItem).where(CustomerRequestItem.normalized_name == normalized)).scalar_one_or_none()
+    item = items_by_name.get(normalized)
     if item:
         if not item.active:
             item.active = True
@@ -58,6 +64,7 @@ def _get_or_create_item(db: Session, *, raw_name: str, principal_id: int) -> Cus
     )
     db.add(item)
     db.flush()
+    items_by_name[normalized] = item
     return item
 
 
@@ -84,8 +91,16 @@ def create_submission(
     db.add(submission)
     db.flush()
 
+    names = {normalize_name(raw_name) for raw_name in counts}
+    items_by_name = {
+        item.normalized_name: item
+        for item in db.execute(
+            select(CustomerRequestItem).where(CustomerRequestItem.normalized_name.in_(names))
+        ).scalars()
+    }
+
     for raw_name, qty in counts.items():
-        item = _get_or_create_item(db, raw_name=raw_name, principal_id=principal_id)
+        item = _get_or_create_item(db, raw_name=raw_name, principal_id=principal_id, items_by_name=items_by_name)
         item.request_count = max(0, item.request_count + qty)
         db.add(
             CustomerRequestLine(
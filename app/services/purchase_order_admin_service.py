@@ -719,6 +719,7 @@ def generate_purchase_orders(
     orders_by_vendor: dict[int, PurchaseOrder] = {}
     created_orders: list[PurchaseOrder] = []
     variation_ids_by_order_id: dict[int, set[str]] = {}
+    pending_allocations: list[tuple[PurchaseOrderLine, list]] = []
     for (vendor_id, sku), store_lines in grouped.items():
         po = orders_by_vendor.get(vendor_id)
         if po is None:
@@ -791,7 +792,11 @@ def generate_purchase_orders(
             removed=False,
         )
         db.add(po_line)
-        db.flush()
+        pending_allocations.append((po_line, store_lines))
+
+    # Flush the pending lines together so their ids exist before the allocations are built.
+    db.flush()
+    for po_line, store_lines in pending_allocations:
         for row in store_lines:
             allocated_qty = row.result.rounded_recommended_qty
             manual_par_level = (
@@ -880,6 +885,7 @@ def create_purchase_order_from_stock_coverage_rows(
     db.flush()
 
     used_variation_ids: set[str] = set()
+    pending_allocations: list[tuple[PurchaseOrderLine, dict[int, int], int]] = []
     for row in selected_rows:
         store_qty_by_id = {
             int(split.store_id): int(split.recommended_purchase_quantity)
@@ -924,7 +930,10 @@ def create_purchase_order_from_stock_coverage_rows(
             removed=False,
         )
         db.add(po_line)
-        db.flush()
+        pending_allocations.append((po_line, store_qty_by_id, qty))
+
+    db.flush()
+    for po_line, store_qty_by_id, qty in pending_allocations:
         for store_row in active_stores:
             store_id = int(store_row.id)
             allocated_qty = store_qty_by_id.get(store_id, 0)
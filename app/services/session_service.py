@@ -254,12 +254,15 @@ def save_draft_entries(
         for row in db.execute(select(SnapshotLine.variation_id).where(SnapshotLine.session_id == session_id)).all()
     }
 
+    existing_entries = {
+        entry.variation_id: entry
+        for entry in db.execute(select(Entry).where(Entry.session_id == session_id)).scalars().all()
+    }
+
     for variation_id, qty in quantities_by_variation.items():
         if variation_id not in valid_variations:
             continue
-        existing = db.execute(
-            select(Entry).where(and_(Entry.session_id == session_id, Entry.variation_id == variation_id))
-        ).scalar_one_or_none()
+        existing = existing_entries.get(variation_id)
         if existing:
             existing.counted_qty = qty
             existing.updated_by_principal_id = principal.id
@@ -388,8 +388,13 @@ def save_vendor_settings(
 
 
 def _order_cost_snapshot(db: Session, order_id: int) -> tuple[Decimal, bool]:
-    value, missing_cost_count = db.execute(
+    return _order_cost_snapshots(db, [order_id])[order_id]
+
+
+def _order_cost_snapshots(db: Session, order_ids: list[int]) -> dict[int, tuple[Decimal, bool]]:
+    rows = db.execute(
         select(
+            PurchaseOrderLine.purchase_order_id,
             func.coalesce(
                 func.sum(PurchaseOrderLine.ordered_qty * PurchaseOrderLine.unit_cost),
                 Decimal('0'),
@@ -398,12 +403,18 @@ def _order_cost_snapshot(db: Session, order_id: int) -> tuple[Decimal, bool]:
                 PurchaseOrderLine.ordered_qty > 0,
                 PurchaseOrderLine.unit_cost.is_(None),
             ),
-        ).where(
-            PurchaseOrderLine.purchase_order_id == order_id,
+        )
+        .where(
+            PurchaseOrderLine.purchase_order_id.in_(order_ids or [-1]),
             PurchaseOrderLine.removed.is_(False),
         )
-    ).one()
-    return money(value), int(missing_cost_count) == 0
+        .group_by(PurchaseOrderLine.purchase_order_id)
+    ).all()
+    snapshots = {
+        int(order_id): (money(value), int(missing_cost_count) == 0)
+        for order_id, value, missing_cost_count in rows
+    }
+    return {order_id: snapshots.get(order_id, (money(0), True)) for order_id in order_ids}
 
 
 def _order_date(order: PurchaseOrder) -> date:
@@ -425,12 +436,20 @@ def current_vendor_classification(
 
 
 def _canonical_received_quantity(db: Session, *, order_id: int) -> int:
-    return int(db.scalar(
-        select(func.coalesce(func.sum(PurchaseOrderLine.received_qty_total), 0)).where(
-            PurchaseOrderLine.purchase_order_id == order_id,
+    return _canonical_received_quantities(db, order_ids=[order_id])[order_id]
+
+
+def _canonical_received_quantities(db: Session, *, order_ids: list[int]) -> dict[int, int]:
+    rows = db.execute(
+        select(PurchaseOrderLine.purchase_order_id, func.sum(PurchaseOrderLine.received_qty_total))
+        .where(
+            PurchaseOrderLine.purchase_order_id.in_(order_ids or [-1]),
             PurchaseOrderLine.removed.is_(False),
         )
-    ) or 0)
+        .group_by(PurchaseOrderLine.purchase_order_id)
+    ).all()
+    received = {int(order_id): int(quantity or 0) for order_id, quantity in rows}
+    return {order_id: received.get(order_id, 0) for order_id in order_ids}
 
 
 def initialize_order_payment(
@@ -628,6 +647,8 @@ def historical_backfill_preview(
         ).all()
     }
     store_names = purchase_order_scope_names(db, order_ids=order_ids)
+    cost_snapshots = _order_cost_snapshots(db, order_ids)
+    received_quantities = _canonical_received_quantities(db, order_ids=order_ids)
     rows = []
     for order in orders:
         order_id = int(order.id)
@@ -637,7 +658,7 @@ def historical_backfill_preview(
             or (scope_type == 'FROM_DATE' and effective_from is not None and order_date >= effective_from)
             or (scope_type == 'SELECTED' and order_id in selected)
         )
-        amount, cost_complete = _order_cost_snapshot(db, order_id)
+        amount, cost_complete = cost_snapshots[order_id]
         existing = existing_by_order.get(order_id)
         reason = None
         action = 'CREATE'
@@ -654,7 +675,7 @@ def historical_backfill_preview(
         elif not cost_complete:
             action, reason = 'BLOCKED', 'Saved V1 line-cost snapshots are incomplete.'
         elif method.category == 'CONSIGNMENT':
-            received_qty = _canonical_received_quantity(db, order_id=order_id)
+            received_qty = received_quantities[order_id]
             receipt_blocker = None
             if received_qty <= 0:
                 action = 'BLOCKED'
@@ -1153,11 +1174,13 @@ def order_payment_list_rows(db: Session) -> list[dict]:
         int(row.id): row for row in db.scalars(select(PaymentMethod)).all()
     }
     store_names = purchase_order_scope_names(db, order_ids=order_ids)
+    cost_snapshots = _order_cost_snapshots(db, order_ids)
+    received_quantities = _canonical_received_quantities(db, order_ids=order_ids)
     rows = []
     for order in orders:
         payment = payments.get(int(order.id))
         classification = classifications.get(int(order.vendor_id))
-        amount, complete = _order_cost_snapshot(db, int(order.id))
+        amount, complete = cost_snapshots[int(order.id)]
         if payment is not None:
             position = (
                 order_financial_position(db, order_payment_id=payment.id)
@@ -1174,7 +1197,7 @@ def order_payment_list_rows(db: Session) -> list[dict]:
             reason = 'Ready for an owner-saved financial assignment.'
         elif (
             classification.is_consignment
-            and _canonical_received_quantity(db, order_id=int(order.id)) <= 0
+            and received_quantities[int(order.id)] <= 0
         ):
             display_state = 'UNINITIALIZED'
             reason = 'Waiting for a canonical V1 receipt before entering consignment.'
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.db import get_db
+from app.models import AuthEvent
+from app.routers import auth as auth_router
+from app.security.csrf import verify_csrf
+
+
+class _ScalarResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class _LoginDb:
+    def __init__(self, principal):
+        self.principal = principal
+        self.added = []
+        self.commits = 0
+
+    def execute(self, _statement):
+        return _ScalarResult(self.principal)
+
+    def add(self, row):
+        self.added.append(row)
+
+    def commit(self):
+        self.commits += 1
+
+
+class _Templates:
+    def TemplateResponse(self, name, context, status_code=200):
+        return PlainTextResponse(f"{name}:{context['error']}", status_code=status_code)
+
+
+def _client(db) -> TestClient:
+    app = FastAPI()
+    app.state.templates = _Templates()
+    app.include_router(auth_router.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[verify_csrf] = lambda: None
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ('principal', 'password_ok', 'reason', 'principal_id'),
+    [
+        (None, False, 'UNKNOWN_USERNAME', None),
+        (SimpleNamespace(id=4, active=False, password_hash='hash'), True, 'INACTIVE_PRINCIPAL', 4),
+        (SimpleNamespace(id=4, active=True, password_hash='hash'), False, 'BAD_PASSWORD', 4),
+    ],
+)
+def test_failed_login_records_reason_and_renders_generic_error(monkeypatch, principal, password_ok, reason, principal_id):
+    monkeypatch.setattr(auth_router, 'verify_password', lambda _password, _hash: password_ok)
+    db = _LoginDb(principal)
+
+    with _client(db) as client:
+        response = client.post('/login', data={'username': ' person ', 'password': 'secret'}, follow_redirects=False)
+
+    assert response.status_code == 401
+    assert response.text == 'login.html:Invalid username or password'
+    assert db.commits == 1
+    [event] = db.added
+    assert isinstance(event, AuthEvent)
+    assert (event.attempted_username, event.success, event.failure_reason, event.principal_id) == (
+        'person',
+        False,
+        reason,
+        principal_id,
+    )
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.auth import Principal, Role
+from app.config import settings
+from app.security import sessions as session_module
+
+
+class _NullSession:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def commit(self):
+        pass
+
+
+def _app(monkeypatch, *, signed_in: bool) -> tuple[FastAPI, list]:
+    principal = Principal(id=3, username='manager', role=Role.MANAGER, store_id=None, active=True)
+    web_session = SimpleNamespace(id=9, current_store_id=None, current_store_checked_at=None, created_at=None)
+    flag_lookups: list = []
+
+    def effective_permission_flags(_db, *, principal):
+        flag_lookups.append(principal.id)
+        return {'management.access': True}
+
+    monkeypatch.setattr(session_module, 'SessionLocal', _NullSession)
+    monkeypatch.setattr(
+        session_module,
+        'load_session_from_token',
+        lambda _db, _token: (web_session, principal) if signed_in else None,
+    )
+    monkeypatch.setattr(session_module, 'effective_permission_flags', effective_permission_flags)
+    monkeypatch.setattr(settings, 'session_cookie_secure', False)
+
+    app = FastAPI()
+    session_module.install_auth_session_middleware(app)
+
+    @app.get('/v2-assets/x.css')
+    def asset(request: Request):
+        return request.state.permission_flags
+
+    @app.get('/management/home')
+    def home(request: Request):
+        return request.state.permission_flags
+
+    return app, flag_lookups
+
+
+def test_static_assets_skip_permission_flag_lookup(monkeypatch):
+    app, flag_lookups = _app(monkeypatch, signed_in=True)
+    with TestClient(app) as client:
+        client.cookies.set(settings.session_cookie_name, 'token')
+        assert client.get('/v2-assets/x.css').json() == {}
+        assert flag_lookups == []
+        assert client.get('/management/home').json() == {'management.access': True}
+        assert flag_lookups == [3]
+
+
+def test_signed_out_static_asset_request_still_redirects_to_login(monkeypatch):
+    app, flag_lookups = _app(monkeypatch, signed_in=False)
+    with TestClient(app) as client:
+        response = client.get('/v2-assets/x.css', follow_redirects=False)
+    assert response.status_code == 303
+    assert response.headers['location'] == '/login'
+    assert flag_lookups == []
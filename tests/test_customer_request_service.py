@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+
+from app.models import CustomerRequestItem, CustomerRequestLine, CustomerRequestSubmission
+from app.services.customer_request_service import create_submission
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalar_one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def scalars(self):
+        return self
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class _SubmissionDb:
+    def __init__(self, *results):
+        self.results = [_Result(rows) for rows in results]
+        self.statements = []
+        self.added = []
+        self.next_id = 100
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return self.results.pop(0)
+
+    def add(self, row):
+        self.added.append(row)
+
+    def flush(self):
+        for row in self.added:
+            if getattr(row, 'id', None) is None:
+                row.id = self.next_id
+                self.next_id += 1
+
+
+class CreateSubmissionTests(unittest.TestCase):
+    def test_items_are_loaded_once_and_duplicate_new_names_share_one_item(self) -> None:
+        existing = CustomerRequestItem(id=7, name='Tape', normalized_name='tape', request_count=3, active=False)
+        db = _SubmissionDb([SimpleNamespace(id=10)], [existing])
+
+        submission = create_submission(
+            db,
+            store_id=10,
+            principal_id=3,
+            requested_items_raw='Tape\nnew thing, New  Thing',
+            notes=None,
+        )
+
+        self.assertEqual(len(db.statements), 2)
+        lookup_names = db.statements[1].compile().params
+        self.assertEqual(set(next(iter(lookup_names.values()))), {'tape', 'new thing'})
+        self.assertEqual(existing.request_count, 4)
+        self.assertTrue(existing.active)
+
+        created = [row for row in db.added if isinstance(row, CustomerRequestItem)]
+        self.assertEqual(len(created), 1)
+        self.assertEqual((created[0].normalized_name, created[0].request_count), ('new thing', 2))
+
+        lines = [row for row in db.added if isinstance(row, CustomerRequestLine)]
+        self.assertIsInstance(submission, CustomerRequestSubmission)
+        self.assertEqual(
+            [(line.raw_name, line.item_id, line.submission_id) for line in lines],
+            [
+                ('Tape', 7, submission.id),
+                ('new thing', created[0].id, submission.id),
+                ('New Thing', created[0].id, submission.id),
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,19 @@
 from types import SimpleNamespace
 
 import pytest
-from fastapi import HTTPException
-
-from app.auth import Principal, Role, assert_store_scope, is_admin_role, require_role
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.auth import (
+    Principal,
+    Role,
+    assert_store_scope,
+    get_current_principal,
+    is_admin_role,
+    require_role,
+)
+from app.models import PrincipalRole
+from app.routers import management
 from app.routers.management import employee_logs_access, employee_logs_admin_access
 from app.routers.v2 import _visible_navigation
 from app.services.access_control_service import (
@@ -66,6 +76,11 @@ def _principal(role=Role.LEAD, store_id=None):
     return Principal(id=7, username='person', role=role, store_id=store_id, active=True)
 
 
+def test_auth_roles_mirror_persisted_principal_roles():
+    assert [role.value for role in Role] == [role.value for role in PrincipalRole]
+    assert all(Role(role.value) == role for role in PrincipalRole)
+
+
 @pytest.mark.parametrize('role', list(Role))
 def test_default_capability_matrix(role):
     actual = tuple(fallback_allowed_for_role(role=role, permission_key=key) for key in CAPABILITIES)
@@ -135,6 +150,45 @@ def test_literal_admin_dependency_ignores_manager_legacy_admin_behavior():
     assert is_admin_role(Role.LEAD) is False
 
 
+def test_role_dependency_is_shared_across_equivalent_role_sets():
+    assert require_role(Role.ADMIN) is require_role(Role.ADMIN)
+    assert require_role(Role.ADMIN, Role.LEAD) is require_role(Role.LEAD, Role.ADMIN)
+    assert require_role(Role.ADMIN) is not require_role(Role.ADMIN, Role.MANAGER)
+
+
+class _CountingPrincipal:
+    role = Role.ADMIN
+
+    def __init__(self):
+        self.active_reads = 0
+
+    @property
+    def active(self):
+        self.active_reads += 1
+        return True
+
+
+def test_current_principal_is_resolved_once_per_request_across_dependency_chains():
+    principal = _CountingPrincipal()
+    app = FastAPI()
+
+    @app.middleware('http')
+    async def attach_principal(request, call_next):
+        request.state.principal = principal
+        return await call_next(request)
+
+    @app.get('/guarded')
+    def guarded(
+        _admin=Depends(require_role(Role.ADMIN)),
+        _current=Depends(get_current_principal),
+    ):
+        return {'ok': True}
+
+    with TestClient(app) as client:
+        assert client.get('/guarded').status_code == 200
+    assert principal.active_reads == 1
+
+
 def test_employee_log_wrappers_preserve_lead_and_legacy_admin_rules():
     assert employee_logs_access(_principal(Role.LEAD)).role == Role.LEAD
     with pytest.raises(HTTPException):
@@ -162,6 +216,35 @@ class _CaptureDb:
         return _EmployeeRows()
 
 
+class _NoQueryDb:
+    def execute(self, _statement):
+        raise AssertionError('home must reuse the middleware permission flags')
+
+    def commit(self):
+        pass
+
+
+def test_home_dashboard_uses_request_permission_flags(monkeypatch):
+    captured = {}
+
+    def build_sections(_db, **kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr(management, 'build_dashboard_sections', build_sections)
+    monkeypatch.setattr(management, 'allowed_dashboard_category_ids_for_role', lambda _db, role: None)
+    templates = SimpleNamespace(TemplateResponse=lambda name, context: context)
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(templates=templates)),
+        state=SimpleNamespace(permission_flags={'management.access': True, 'management.admin': False, 'store.access': True}),
+    )
+
+    context = management.home(request, principal=_principal(Role.MANAGER), db=_NoQueryDb())
+
+    assert captured['allowed_permission_keys'] == {'management.access', 'management.groups', 'store.access'}
+    assert context['can_manage_layout'] is False
+
+
 def test_visible_to_leads_filter_is_applied_unless_hidden_access_is_explicit():
     lead_db = _CaptureDb()
     list_employees_for_entry(lead_db, include_hidden=False)
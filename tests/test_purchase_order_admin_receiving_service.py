@@ -5,10 +5,20 @@ from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from app.models import PurchaseOrder, PurchaseOrderLine, PurchaseOrderStoreAllocation, Store, Vendor, VendorSkuConfig
+from app.models import (
+    ParLevelSource,
+    PurchaseOrder,
+    PurchaseOrderConfidenceState,
+    PurchaseOrderLine,
+    PurchaseOrderStoreAllocation,
+    Store,
+    Vendor,
+    VendorSkuConfig,
+)
 from app.services.inventory_velocity_report_service import StockCoveragePurchaseRow, StoreDemandSplit
 from app.services.purchase_order_admin_service import (
     create_purchase_order_from_stock_coverage_rows,
+    generate_purchase_orders,
     _line_matches_barcode,
     _normalize_scan_key,
     _select_next_receiving_store,
@@ -75,20 +85,22 @@ class _RowsResult:
 
 
 class _PurchaseOrderCreateDb:
-    def __init__(self):
+    def __init__(self, skus: tuple[str, ...] = ('SKU-1',)):
         self.added: list = []
+        self.flush_calls = 0
         self._results = [
             _ScalarOneResult(Vendor(id=20, square_vendor_id='VENDOR-20', name='Vendor A', active=True)),
             _RowsResult([
                 VendorSkuConfig(
-                    id=30,
+                    id=30 + index,
                     vendor_id=20,
-                    sku='SKU-1',
-                    square_variation_id='VAR-1',
+                    sku=sku,
+                    square_variation_id=f'VAR-{index + 1}',
                     unit_cost=Decimal('4.00'),
                     active=True,
                     is_default_vendor=True,
                 )
+                for index, sku in enumerate(skus)
             ]),
             _RowsResult([Store(id=1, name='Highway 99', active=True), Store(id=2, name='Longview', active=True)]),
         ]
@@ -100,6 +112,7 @@ class _PurchaseOrderCreateDb:
         self.added.append(row)
 
     def flush(self) -> None:
+        self.flush_calls += 1
         next_po_id = 100
         next_line_id = 200
         for row in self.added:
@@ -111,6 +124,53 @@ class _PurchaseOrderCreateDb:
                 next_line_id += 1
 
 
+class _FirstResult:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class _GeneratePurchaseOrdersDb:
+    def __init__(self):
+        self.added: list = []
+        self.next_id = 200
+        self._results = [
+            _FirstResult((1,)),
+            _RowsResult([SimpleNamespace(id=20, name='Vendor A'), SimpleNamespace(id=21, name='Vendor B')]),
+            _RowsResult([]),
+        ]
+
+    def execute(self, _query):
+        return self._results.pop(0)
+
+    def add(self, row) -> None:
+        self.added.append(row)
+
+    def flush(self) -> None:
+        for row in self.added:
+            if isinstance(row, (PurchaseOrder, PurchaseOrderLine)) and row.id is None:
+                row.id = self.next_id
+                self.next_id += 1
+
+
+def recommendation(vendor_id: int, store_id: int, sku: str, qty: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        vendor_id=vendor_id,
+        store_id=store_id,
+        sku=sku,
+        result=SimpleNamespace(
+            rounded_recommended_qty=qty,
+            suggested_stock_up_level=qty,
+            confidence_score=Decimal('1'),
+            confidence_state=PurchaseOrderConfidenceState.NORMAL,
+            par_source=ParLevelSource.DYNAMIC,
+            effective_reorder_level=qty,
+        ),
+    )
+
+
 class PurchaseOrderAdminReceivingServiceTests(unittest.TestCase):
     def test_store_receive_priority_orders_requested_stores(self) -> None:
         stores = [
@@ -278,6 +338,95 @@ class PurchaseOrderAdminReceivingServiceTests(unittest.TestCase):
         self.assertEqual(lines[0].suggested_par_level, 60)
         self.assertEqual([allocation.allocated_qty for allocation in allocations], [30, 20])
 
+    @patch('app.services.purchase_order_admin_service.fetch_catalog_by_sku')
+    def test_create_purchase_order_from_stock_coverage_rows_flushes_lines_together(self, catalog_mock) -> None:
+        catalog_mock.return_value = {}
+        db = _PurchaseOrderCreateDb(skus=('SKU-1', 'SKU-2'))
+        rows = [
+            StockCoveragePurchaseRow(
+                rank=index + 1,
+                sku=sku,
+                product_name=sku,
+                category='Category',
+                vendor='Vendor A',
+                units_sold=Decimal('30'),
+                average_units_sold_per_day=Decimal('1'),
+                target_months=Decimal('2'),
+                target_days=Decimal('60'),
+                target_inventory_quantity=Decimal('60'),
+                current_inventory_quantity=Decimal('10'),
+                recommended_purchase_quantity=Decimal(qty),
+                estimated_purchase_cost=Decimal('200'),
+                days_of_supply_remaining=Decimal('10'),
+                store_location_breakdown='',
+                vendor_id=20,
+                store_splits=[],
+            )
+            for index, (sku, qty) in enumerate((('SKU-1', '5'), ('SKU-2', '7')))
+        ]
+
+        create_purchase_order_from_stock_coverage_rows(
+            db,
+            vendor_id=20,
+            rows=rows,
+            created_by_principal_id=5,
+            history_lookback_days=30,
+            target_months=Decimal('2'),
+        )
+
+        allocations = [item for item in db.added if isinstance(item, PurchaseOrderStoreAllocation)]
+        self.assertEqual(db.flush_calls, 3)
+        self.assertEqual(
+            [(allocation.purchase_order_line_id, allocation.store_id, allocation.allocated_qty) for allocation in allocations],
+            [(200, 1, 5), (200, 2, 0), (201, 1, 7), (201, 2, 0)],
+        )
+
+
+    @patch('app.services.purchase_order_admin_service.generate_vendor_scoped_recommendations')
+    @patch('app.services.purchase_order_admin_service.build_square_ordering_snapshot')
+    @patch('app.services.purchase_order_admin_service.sync_vendor_sku_configs_from_square')
+    def test_generate_purchase_orders_allocations_follow_their_lines_across_vendors(
+        self,
+        _sync_mock,
+        snapshot_mock,
+        recommendations_mock,
+    ) -> None:
+        snapshot_mock.return_value = SimpleNamespace(
+            meta_by_vendor_sku={(20, 'SKU-A'): SimpleNamespace(variation_id='VAR-A')},
+            history_loader=None,
+            on_hand_loader=None,
+            meta_for=lambda _vendor_id, _sku: None,
+        )
+        recommendations_mock.return_value = [
+            recommendation(20, 1, 'SKU-A', 3),
+            recommendation(20, 2, 'SKU-A', 4),
+            recommendation(20, 1, 'SKU-B', 5),
+            recommendation(21, 1, 'SKU-C', 6),
+        ]
+        db = _GeneratePurchaseOrdersDb()
+
+        orders, _warnings = generate_purchase_orders(
+            db,
+            vendor_ids=[20, 21],
+            created_by_principal_id=5,
+            reorder_weeks=2,
+            stock_up_weeks=4,
+            history_lookback_days=30,
+        )
+
+        lines = {line.sku: line for line in db.added if isinstance(line, PurchaseOrderLine)}
+        allocations = [item for item in db.added if isinstance(item, PurchaseOrderStoreAllocation)]
+        self.assertEqual([order.vendor_id for order in orders], [20, 21])
+        self.assertEqual(len({line.id for line in lines.values()}), 3)
+        self.assertEqual(
+            [(allocation.purchase_order_line_id, allocation.store_id, allocation.allocated_qty) for allocation in allocations],
+            [
+                (lines['SKU-A'].id, 1, 3),
+                (lines['SKU-A'].id, 2, 4),
+                (lines['SKU-B'].id, 1, 5),
+                (lines['SKU-C'].id, 1, 6),
+            ],
+        )
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,7 +4,37 @@ import unittest
 from decimal import Decimal
 from types import SimpleNamespace
 
-from app.services.session_service import _evaluate_recount_rows
+from app.auth import Principal, Role
+from app.models import Entry, SessionStatus
+from app.services.session_service import _evaluate_recount_rows, save_draft_entries
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalar_one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _DraftDb:
+    def __init__(self, *results):
+        self.results = [_Result(rows) for rows in results]
+        self.executed = 0
+        self.added = []
+
+    def execute(self, _statement):
+        self.executed += 1
+        return self.results.pop(0)
+
+    def add(self, row):
+        self.added.append(row)
 
 
 class RecountLogicServiceTests(unittest.TestCase):
@@ -104,5 +134,30 @@ class RecountLogicServiceTests(unittest.TestCase):
         self.assertEqual(max_consecutive, 1)
 
 
+class SaveDraftEntriesTests(unittest.TestCase):
+    def test_existing_entries_are_loaded_once_and_new_entries_are_added(self) -> None:
+        principal = Principal(id=3, username='store', role=Role.STORE, store_id=10, active=True)
+        existing = SimpleNamespace(variation_id='var-1', counted_qty=Decimal('1'), updated_by_principal_id=9, updated_at=None)
+        db = _DraftDb(
+            [SimpleNamespace(id=5, store_id=10, status=SessionStatus.DRAFT)],
+            [('var-1',), ('var-2',), ('var-3',)],
+            [existing],
+        )
+
+        save_draft_entries(
+            db,
+            principal=principal,
+            session_id=5,
+            quantities_by_variation={'var-1': Decimal('4'), 'var-2': Decimal('2'), 'unknown': Decimal('7')},
+        )
+
+        self.assertEqual(db.executed, 3)
+        self.assertEqual(existing.counted_qty, Decimal('4'))
+        self.assertEqual(existing.updated_by_principal_id, 3)
+        self.assertEqual(len(db.added), 1)
+        self.assertIsInstance(db.added[0], Entry)
+        self.assertEqual((db.added[0].variation_id, db.added[0].counted_qty), ('var-2', Decimal('2')))
+
+
 if __name__ == '__main__':
     unittest.main()